@@ -1,12 +1,13 @@
 import os
 import json
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.models.openai import OpenAIModel
 from loguru import logger
 from dotenv import load_dotenv, get_key
 
+from .schemas import JudgeContext, Judgement
+
 # Load environment variables from .env file
 env_path = os.path.join(os.path.dirname(__file__), "..", "..", ".env")
 load_dotenv(env_path)
@@ -18,59 +19,53 @@ if not api_key:
     raise ValueError("OPENROUTER_API_KEY environment variable is required")
 
 
-class Judgement(BaseModel):
-    correct: bool
-    feedback: str
+judge_agent = Agent(
+    system_prompt="""
+    You are a Jeopardy game judge. Evaluate answers based on what you know about Jeopardy rules. We SHOULD NOT care about the phrasing of the answer (ie. answers do not need to be in form of a question)",
+    Spelling or capitalization shouldn't matter if the answer is close enough to being correct (unless the category requires it)
+    Only provide feedback on incorrect answers.
+    NEVER DISCLOSE THE CORRECT ANSWER IN THE FEEDBACK.
+    """,
+    result_type=Judgement,
+    model=OpenAIModel(
+        model_name="google/gemini-flash-1.5",
+        base_url="https://openrouter.ai/api/v1",
+        api_key=api_key,
+    ),
+    deps_type=JudgeContext,
+)
 
 
-class JudgeContext(BaseModel):
-    category: str
-    clue: str
-    comments: str
-    correct_answer: str
-    user_answer: str
+@judge_agent.system_prompt
+def add_category_prompt(ctx: RunContext[JudgeContext]) -> str:
+    return f"The category is: {ctx.deps.category}"
 
 
-def get_judge_agent():
-    agent = Agent(
-        system_prompt="""
-        You are a Jeopardy game judge. Evaluate answers based on what you know about Jeopardy rules. We SHOULD NOT care about the phrasing of the answer (ie. answers do not need to be in form of a question)",
-        Spelling or capitalization shouldn't matter if the answer is close enough to being correct (unless the category requires it)
-        Only provide feedback on incorrect answers.
-        NEVER DISCLOSE THE CORRECT ANSWER IN THE FEEDBACK.
-        """,
-        result_type=Judgement,
-        model=OpenAIModel(
-            model_name="google/gemini-flash-1.5",
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-        ),
-        deps_type=JudgeContext,
-    )
+@judge_agent.system_prompt
+def add_clue_prompt(ctx: RunContext[JudgeContext]) -> str:
+    return f"The clue is: {ctx.deps.clue}"
 
-    @agent.system_prompt
-    def add_category_prompt(ctx: RunContext[JudgeContext]) -> str:
-        return f"The category is: {ctx.deps.category}"
 
-    @agent.system_prompt
-    def add_clue_prompt(ctx: RunContext[JudgeContext]) -> str:
-        return f"The clue is: {ctx.deps.clue}"
+@judge_agent.system_prompt
+def add_correct_answer_prompt(ctx: RunContext[JudgeContext]) -> str:
+    return f"The correct answer is: {ctx.deps.correct_answer}"
 
-    @agent.system_prompt
-    def add_correct_answer_prompt(ctx: RunContext[JudgeContext]) -> str:
-        return f"The correct answer is: {ctx.deps.correct_answer}"
 
-    @agent.system_prompt
-    def add_user_answer_prompt(ctx: RunContext[JudgeContext]) -> str:
-        return f"The user answered: {ctx.deps.user_answer}"
+@judge_agent.system_prompt
+def add_user_answer_prompt(ctx: RunContext[JudgeContext]) -> str:
+    return f"The user answered: {ctx.deps.user_answer}"
 
-    @agent.system_prompt
-    def add_comments_prompt(ctx: RunContext[JudgeContext]) -> str:
-        if ctx.deps.comments:
-            return f"Additional context: {ctx.deps.comments}"
-        return ""
 
-    return agent
+@judge_agent.system_prompt
+def add_comments_prompt(ctx: RunContext[JudgeContext]) -> str:
+    if ctx.deps.comments:
+        return f"Additional context: {ctx.deps.comments}"
+    return ""
+
+
+def get_judge_agent():
+    """Return the shared judge agent; its prompts are registered once at import"""
+    return judge_agent
 
 
 # Example usage
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+
+from ..models.models import JudgementRecord
+from .schemas import Judgement
+
+
+def normalize_answer(user_answer: str) -> str:
+    return user_answer.strip().casefold()
+
+
+class JudgementCache:
+    """
+    LRU cache of judge agent verdicts keyed on (clue_id, normalized answer).
+
+    Only exact matches hit: near-identical answers can still differ in the
+    one token that matters ("18th" vs "19th", "I" vs "II"), so anything else
+    goes to the judge. Verdicts are written through to the judgement_cache
+    table so they survive restarts.
+    """
+
+    def __init__(self, session_factory, maxsize: int = 100_000):
+        self.session_factory = session_factory
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[int, str], Judgement] = OrderedDict()
+
+    async def load(self) -> None:
+        """Fill the in-memory cache with the most recently stored verdicts"""
+        async with self.session_factory() as session:
+            records = (
+                await session.scalars(
+                    select(JudgementRecord)
+                    .order_by(JudgementRecord.id.desc())
+                    .limit(self.maxsize)
+                )
+            ).all()
+        for record in reversed(records):
+            self._remember(
+                (record.clue_id, record.user_answer),
+                Judgement.model_construct(correct=record.correct, feedback=record.feedback),
+            )
+        logger.info("Loaded {} cached judgements", len(records))
+
+    def get(self, clue_id: int, user_answer: str) -> Optional[Judgement]:
+        key = (clue_id, normalize_answer(user_answer))
+        judgement = self._entries.get(key)
+        if judgement is not None:
+            self._entries.move_to_end(key)
+        return judgement
+
+    async def put(self, clue_id: int, user_answer: str, judgement: Judgement) -> None:
+        key = (clue_id, normalize_answer(user_answer))
+        self._remember(key, judgement)
+        async with self.session_factory() as session:
+            await session.execute(
+                insert(JudgementRecord)
+                .values(
+                    clue_id=key[0],
+                    user_answer=key[1],
+                    correct=judgement.correct,
+                    feedback=judgement.feedback,
+                )
+                .on_conflict_do_update(
+                    index_elements=["clue_id", "user_answer"],
+                    set_={"correct": judgement.correct, "feedback": judgement.feedback},
+                )
+            )
+            await session.commit()
+
+    def _remember(self, key: tuple[int, str], judgement: Judgement) -> None:
+        self._entries[key] = judgement
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
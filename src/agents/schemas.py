@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class Judgement(BaseModel):
+    correct: bool
+    feedback: str
+
+
+class JudgeContext(BaseModel):
+    category: str
+    clue: str
+    comments: str
+    correct_answer: str
+    user_answer: str
@@ -0,0 +1,104 @@
+import random
+from datetime import date
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import RowMapping
+
+# Fields returned for each clue by /round
+ROUND_CLUE_FIELDS = (
+    "id",
+    "clue_value",
+    "is_daily_double",
+    "clue_text",  # The clue/question shown to player
+    "correct_answer",  # The answer they need to guess
+    "air_date",
+    "notes",
+)
+
+CLUES_PER_BOARD = 5
+
+
+class BoardIndex:
+    """
+    In-memory index of every complete category board, built once from the
+    immutable clues table so /round never touches the database.
+
+    A board is one category's clues from one air date with all 5 distinct
+    clue values. Clue fields are kept as parallel lists (struct of arrays)
+    in `columns`; `boards[round][category][air_date]` is the range of
+    positions holding that board's clues, in clue_value order.
+    `air_dates[(round, category)]` lists the same air dates so picking one
+    at random is O(1).
+    """
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[Any]] = {field: [] for field in ROUND_CLUE_FIELDS}
+        self.boards: Dict[int, Dict[str, Dict[date, range]]] = {}
+        self.air_dates: Dict[tuple[int, str], List[date]] = {}
+        # Categories with at least one complete board, per round
+        self.categories_by_round: Dict[int, List[str]] = {}
+        # Every category in the table, complete board or not
+        self.all_categories: set[str] = set()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[RowMapping]) -> "BoardIndex":
+        """
+        Build the index from clue rows ordered by round, category,
+        air_date and clue_value (see queries.get_all_round_clues).
+        """
+        index = cls()
+        for (round_value, category, air_date), clues in groupby(
+            rows, key=itemgetter("round", "category", "air_date")
+        ):
+            index.all_categories.add(category)
+            # One clue per value, like the old GROUP BY clue_value query
+            clues = [
+                next(value_clues)
+                for _, value_clues in groupby(clues, key=itemgetter("clue_value"))
+            ]
+            if len(clues) != CLUES_PER_BOARD:
+                continue
+
+            start = len(index.columns["id"])
+            for field, column in index.columns.items():
+                column.extend(clue[field] for clue in clues)
+            index.boards.setdefault(round_value, {}).setdefault(category, {})[
+                air_date
+            ] = range(start, start + CLUES_PER_BOARD)
+
+        index.categories_by_round = {
+            round_value: list(categories)
+            for round_value, categories in index.boards.items()
+        }
+        index.air_dates = {
+            (round_value, category): list(boards)
+            for round_value, categories in index.boards.items()
+            for category, boards in categories.items()
+        }
+        return index
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def pick_random_categories(self, round_value: int, num_categories: int) -> List[str]:
+        categories = self.categories_by_round.get(round_value, [])
+        return random.sample(categories, min(num_categories, len(categories)))
+
+    def pick_air_date(self, round_value: int, category: str) -> Optional[date]:
+        """
+        Return the air date of a random complete board for category, or None
+        if the category has none in this round.
+        """
+        air_dates = self.air_dates.get((round_value, category))
+        if not air_dates:
+            return None
+        return random.choice(air_dates)
+
+    def get_board(self, round_value: int, category: str, air_date: date) -> List[Dict[str, Any]]:
+        positions = self.boards[round_value][category][air_date]
+        return [
+            {field: column[i] for field, column in self.columns.items()}
+            for i in positions
+        ]
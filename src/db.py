@@ -0,0 +1,27 @@
+import sqlalchemy as sa
+
+# Applied to every new SQLite connection. WAL + synchronous=NORMAL only fsyncs
+# on checkpoints instead of on every commit, and lets readers run alongside
+# the writer.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+)
+
+
+def configure_sqlite_engine(engine):
+    """Register a connect hook that applies SQLITE_PRAGMAS"""
+
+    @sa.event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
@@ -1,68 +1,189 @@
 import csv
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 import sqlalchemy as sa
-from sqlalchemy.orm import declarative_base
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 from loguru import logger
-from .models import Clue
+from .db import configure_sqlite_engine
+from .models.models import Base, Clue
 
-# Database setup
-Base = declarative_base()
+DATA_PATH = Path(__file__).parent.parent / 'combined_season1-40.tsv'
+
+# Number of rows sent to the database per executemany call
+BATCH_SIZE = 1000
+
+# Table-level insert: the loader only writes plain dicts, so the ORM insert
+# path and its mapper lookups are never needed
+CLUE_INSERT = Clue.__table__.insert()
 
 def create_db_engine():
     """Create SQLite database engine"""
-    return sa.create_engine('sqlite:///jeopardy.db')
+    return configure_sqlite_engine(sa.create_engine('sqlite:///jeopardy.db'))
+
+# Arrow types for the TSV columns the loader uses
+TSV_COLUMN_TYPES = {
+    'round': pa.int32(),
+    'clue_value': pa.int32(),
+    'daily_double_value': pa.int32(),
+    'category': pa.string(),
+    'comments': pa.string(),
+    'answer': pa.string(),
+    'question': pa.string(),
+    'air_date': pa.date32(),
+    'notes': pa.string(),
+}
+
+def read_clues_table(data_path):
+    """Parse the whole TSV file in C with pyarrow into a table shaped like Clue
+
+    Raises pyarrow.ArrowInvalid if any value fails to convert.
+    """
+    table = pv.read_csv(
+        data_path,
+        parse_options=pv.ParseOptions(delimiter='\t', newlines_in_values=True),
+        convert_options=pv.ConvertOptions(
+            column_types=TSV_COLUMN_TYPES,
+            include_columns=list(TSV_COLUMN_TYPES),
+        ),
+    )
+    clues = pa.table({
+        'round': table['round'],
+        'clue_value': table['clue_value'],
+        'is_daily_double': pc.not_equal(table['daily_double_value'], 0),
+        'category': table['category'],
+        'comments': table['comments'],
+        'clue_text': table['answer'],
+        'correct_answer': table['question'],
+        'air_date': table['air_date'],
+        'notes': table['notes'],
+    })
+    # Empty numeric/date cells come through as nulls; skip those rows like
+    # the csv path does
+    complete = clues.drop_null()
+    dropped = clues.num_rows - complete.num_rows
+    if dropped:
+        logger.warning("Skipped {} rows with empty required values", dropped)
+    return complete
+
+def insert_table(conn, table):
+    """Insert an Arrow table of clues in batches, returning the row count"""
+    total_rows = 0
+    for record_batch in table.to_batches(max_chunksize=BATCH_SIZE):
+        conn.execute(CLUE_INSERT, record_batch.to_pylist())
+        total_rows += record_batch.num_rows
+        logger.info("Processed {} rows...", total_rows)
+    return total_rows
+
+# Columns filled by build_row, in tuple order
+ROW_COLUMNS = (
+    'round', 'clue_value', 'is_daily_double', 'category', 'comments',
+    'clue_text', 'correct_answer', 'air_date', 'notes',
+)
+INSERT_ROW_SQL = (
+    f"INSERT INTO {Clue.__tablename__} ({', '.join(ROW_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(ROW_COLUMNS))})"
+)
+
+def build_row(row):
+    """Convert a csv.DictReader row into an INSERT_ROW_SQL parameter tuple"""
+    return (
+        int(row['round']),
+        int(row['clue_value']),
+        bool(int(row['daily_double_value'])),
+        row['category'],
+        row['comments'],
+        row['answer'],
+        row['question'],
+        # Stored as ISO text, the same format SQLAlchemy's Date uses on SQLite
+        date.fromisoformat(row['air_date']).isoformat(),
+        row['notes'],
+    )
+
+def insert_rows(conn, data_path):
+    """Parse the TSV file row by row and insert it in batches, returning the row count
+
+    Slower than read_clues_table, but skips malformed rows instead of failing.
+    """
+    with open(data_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f, delimiter='\t')
+        batch: list[tuple] = []
+        total_rows = 0
+        
+        for row in reader:
+            try:
+                batch.append(build_row(row))
+            except Exception as e:
+                logger.error("Error processing row {}: {}", row, e)
+                continue
+
+            if len(batch) >= BATCH_SIZE:
+                # Straight to the driver's executemany, skipping the insert
+                # compiler and per-row parameter processing
+                conn.exec_driver_sql(INSERT_ROW_SQL, batch)
+                total_rows += len(batch)
+                batch.clear()
+                logger.info("Processed {} rows...", total_rows)
 
-def load_data(engine):
+        # Flush the final partial batch
+        if batch:
+            conn.exec_driver_sql(INSERT_ROW_SQL, batch)
+            total_rows += len(batch)
+
+    return total_rows
+
+def load_data(engine, data_path=DATA_PATH):
     """Load data from TSV file into database"""
     Base.metadata.create_all(engine)
     
-    data_path = Path(__file__).parent.parent / 'combined_season1-40.tsv'
-    
     if not data_path.exists():
         logger.error("Data file not found at {}", data_path)
         return
 
     logger.info("Loading data from {}", data_path)
+
+    try:
+        table = read_clues_table(data_path)
+    except pa.ArrowInvalid as e:
+        logger.warning("Falling back to row-by-row parsing: {}", e)
+        table = None
     
-    with engine.begin() as conn:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            total_rows = 0
-            
-            for row in reader:
-                try:
-                    # Convert daily_double_value to boolean
-                    is_daily_double = bool(int(row['daily_double_value']))
-                    
-                    # Parse air date
-                    air_date = datetime.strptime(row['air_date'], '%Y-%m-%d').date()
-                    
-                    # Create clue instance
-                    clue = Clue(
-                        round=int(row['round']),
-                        clue_value=int(row['clue_value']),
-                        is_daily_double=is_daily_double,
-                        category=row['category'],
-                        comments=row['comments'],
-                        clue_text=row['answer'],
-                        correct_answer=row['question'],
-                        air_date=air_date,
-                        notes=row['notes']
-                    )
-                    
-                    # Insert row
-                    conn.execute(sa.insert(Clue), [clue.__dict__])
-                    total_rows += 1
-                    
-                    if total_rows % 1000 == 0:
-                        logger.info("Processed {} rows...", total_rows)
-                    
-                except Exception as e:
-                    logger.error("Error processing row {}: {}", row, e)
-                    continue
-            
-            logger.info("Successfully loaded {} rows", total_rows)
+    with engine.connect() as conn:
+        # Stay in WAL so the running API's open connections don't block the
+        # load, but skip fsyncs while it runs. A failed or killed load still
+        # rolls back cleanly; only an OS crash or power loss mid-load can
+        # damage the file.
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        conn.commit()
+
+        try:
+            with conn.begin():
+                # pysqlite only opens a transaction before DML, so begin
+                # explicitly to make the index drop/create roll back with the
+                # rows if the load fails
+                conn.exec_driver_sql("BEGIN")
+
+                # Building indexes once after the load is cheaper than
+                # updating them on every insert
+                for index in Clue.__table__.indexes:
+                    index.drop(conn, checkfirst=True)
+
+                if table is not None:
+                    total_rows = insert_table(conn, table)
+                else:
+                    total_rows = insert_rows(conn, data_path)
+
+                for index in Clue.__table__.indexes:
+                    index.create(conn, checkfirst=True)
+
+                # Refresh planner statistics so SQLite picks the new indexes
+                conn.exec_driver_sql("ANALYZE")
+        finally:
+            conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+            conn.commit()
+
+    logger.info("Successfully loaded {} rows", total_rows)
 
 if __name__ == '__main__':
     engine = create_db_engine()
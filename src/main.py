@@ -1,24 +1,29 @@
+import asyncio
+import functools
 import os
+import secrets
 import sys
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+from dotenv import load_dotenv
 from loguru import logger
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session
-
-from .agents.agents import JudgeContext, get_judge_agent
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .agents.judge import JudgementCache
+from .agents.schemas import JudgeContext
+from .board_index import BoardIndex
+from .db import configure_sqlite_engine
 from .models.models import Base, Clue
-from .queries import (
-    get_all_airdates_for_category_and_round,
-    get_clue_by_id,
-    get_clues_for_category_round_and_airdate,
-    get_first_matching_category_by_name,
-    get_random_categories_matching_round
-)
-
-app = FastAPI()
+from .queries import get_all_round_clues, get_clues_by_ids
 
 # Update log file path to use absolute path
 log_path = os.path.abspath(
@@ -26,26 +31,27 @@ log_path = os.path.abspath(
 )
 os.makedirs(os.path.dirname(log_path), exist_ok=True)
 
+# Set LOG_LEVEL=DEBUG to log request bodies and judge agent exchanges
+log_level = os.getenv("LOG_LEVEL", "INFO")
+
 logger.remove()  # Remove default handler
 logger.add(
     log_path,
     rotation="250 KB",
-    level="DEBUG",
+    level=log_level,
     format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {module}:{function}:{line} | {message}",
     backtrace=True,
     diagnose=True,
 )
 logger.add(sys.stderr, level="INFO")
 
+# Load environment variables from the repo's .env file
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+
+# Shared secret for /admin routes, sent in the X-Admin-Token header. When it
+# is unset every admin request is refused.
+admin_token = os.getenv("ADMIN_TOKEN")
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],  # React dev server
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
 # Get absolute path to database - use the root jeopardy.db
 db_path = os.path.abspath(
@@ -54,12 +60,125 @@ db_path = os.path.abspath(
 logger.info("Database path {}", db_path)
 
 # Database setup
-db_engine = create_engine(f"sqlite:///{db_path}", echo=True)  # Enable SQL logging
-Base.metadata.bind = db_engine
+db_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{db_path}",
+    echo=os.getenv("SQL_ECHO") == "1",  # Set SQL_ECHO=1 to log every statement
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
+)
+configure_sqlite_engine(db_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(db_engine, expire_on_commit=False)
+
+
+def create_schema(connection) -> None:
+    # Create tables if they don't exist
+    Base.metadata.create_all(connection)
+
+    # create_all skips existing tables entirely, so add any indexes that were
+    # introduced after the database was built
+    for index in Clue.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+
+# The clues table is immutable while the server runs, so /round is served
+# entirely from this index. Replaced wholesale by load_board_index().
+board_index = BoardIndex()
+
+
+# Serialized board JSON by (round, category, air_date). Boards only change on
+# /admin/reload, which clears this.
+MAX_CACHED_BOARDS = 10_000
+board_json_cache: OrderedDict[tuple[int, str, date], bytes] = OrderedDict()
+
+
+def get_board_json(round_value: int, category: str, air_date: date) -> bytes:
+    key = (round_value, category, air_date)
+    board_json = board_json_cache.get(key)
+    if board_json is None:
+        board_json = orjson.dumps(board_index.get_board(round_value, category, air_date))
+        board_json_cache[key] = board_json
+        if len(board_json_cache) > MAX_CACHED_BOARDS:
+            board_json_cache.popitem(last=False)
+    else:
+        board_json_cache.move_to_end(key)
+    return board_json
+
 
+async def load_board_index() -> None:
+    """(Re)build board_index from the database"""
+    global board_index
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(get_all_round_clues())
+        board_index = BoardIndex.from_rows(result.mappings())
+    logger.info(
+        "Indexed {} clues; categories per round: {}",
+        len(board_index),
+        {r: len(c) for r, c in board_index.categories_by_round.items()},
+    )
 
-# Create tables if they don't exist
-Base.metadata.create_all(db_engine)
+
+# Recently judged clues by id. Clues never change while the server runs, so
+# repeat answers to the same clue skip the database lookup.
+MAX_CACHED_CLUES = 50_000
+clue_cache: OrderedDict[int, Row] = OrderedDict()
+
+
+async def fetch_clues(clue_ids: Iterable[int]) -> Dict[int, Row]:
+    """
+    Look up clues by id through clue_cache, querying only the misses.
+
+    The misses are read in a session of their own that is closed before
+    returning. /answer then awaits the judge agent and JudgementCache.put
+    opens a session of its own, so holding a connection for the whole
+    request would let concurrent requests exhaust the pool and deadlock.
+    """
+    clues = {}
+    missing = []
+    for clue_id in clue_ids:
+        clue = clue_cache.get(clue_id)
+        if clue is None:
+            missing.append(clue_id)
+        else:
+            clue_cache.move_to_end(clue_id)
+            clues[clue_id] = clue
+
+    if missing:
+        async with AsyncSessionLocal() as session:
+            found = (await session.execute(get_clues_by_ids(missing))).all()
+        for clue in found:
+            clues[clue.id] = clue
+            clue_cache[clue.id] = clue
+        while len(clue_cache) > MAX_CACHED_CLUES:
+            clue_cache.popitem(last=False)
+
+    return clues
+
+
+judgement_cache = JudgementCache(AsyncSessionLocal)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with db_engine.begin() as connection:
+        await connection.run_sync(create_schema)
+    await load_board_index()
+    await judgement_cache.load()
+    yield
+    await db_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
+
+# Add CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:3000"],  # React dev server
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 
 @app.get("/", response_model=Dict[str, str])
@@ -67,8 +186,31 @@ async def root() -> Dict[str, str]:
     return {"message": "Hello, World!"}
 
 
-@app.get("/round/{round_value}", response_model=Dict[str, List[Dict[str, Any]]])
-async def get_round(round_value: int, category: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+def require_admin_token(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    if not admin_token or not x_admin_token or not secrets.compare_digest(
+        x_admin_token.encode(), admin_token.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+@app.post(
+    "/admin/reload",
+    response_model=Dict[str, str],
+    dependencies=[Depends(require_admin_token)],
+)
+async def reload_data() -> Dict[str, str]:
+    """Rebuild the in-memory indexes after the clue data has been reloaded"""
+    await load_board_index()
+    board_json_cache.clear()
+    clue_cache.clear()
+    return {"message": "Reloaded"}
+
+
+@app.get("/round/{round_value}")
+async def get_round(
+    round_value: int,
+    category: Optional[str] = None,
+) -> Response:
     if round_value not in [1, 2]:
         raise HTTPException(
             status_code=400,
@@ -76,92 +218,145 @@ async def get_round(round_value: int, category: Optional[str] = None) -> Dict[st
         )
 
     try:
-        # Create session with immediate execution mode
-        db_session = Session(db_engine, future=True)
-        try:
-            logger.info("Fetching categories for round {}", round_value)
-            # Get 6 random categories for this round using GROUP BY for uniqueness
-            categories_query = (get_random_categories_matching_round(round_value, 6) if not category 
-                                else get_random_categories_matching_round(round_value, 5))
-            categories = db_session.scalars(categories_query).all()
-
-            # If specific category requested, ensure it's included
-            if category:
-                # Verify category exists
-                category_exists = db_session.scalar(get_first_matching_category_by_name(category))
-                if not category_exists:
-                    raise HTTPException(
-                        status_code=404, detail=f"Category '{category}' not found"
-                    )
-
-                # Add the requested category and ensure we have exactly 6 unique categories
-                categories = [category] + [c for c in categories if c != category][:5]
-            logger.info("Found {} random categories: {}", len(categories), categories)
-
-            if not categories:
-                logger.warning("No categories found")
+        logger.info("Fetching categories for round {}", round_value)
+        # Get 6 random categories for this round
+        categories = board_index.pick_random_categories(round_value, 6)
+
+        # If specific category requested, ensure it's included
+        if category:
+            # Verify category exists
+            if category not in board_index.all_categories:
                 raise HTTPException(
-                    status_code=404, detail="No categories found for this round"
+                    status_code=404, detail=f"Category '{category}' not found"
                 )
 
-            round_data = {}
-            for category in categories:
-                logger.info("Fetching clues for category: {}", category)
-
-                # Get all air dates for this category and round
-                air_dates = db_session.scalars(
-                    get_all_airdates_for_category_and_round(category, round_value)
-                ).all()
-
-                #TODO: Right now this will terminate with the first airdate that has 5 clues.
-                #We should instead pick a random airdate and keep trying until we have 5 clues.
-                clues = []
-                for air_date in air_dates:
-                    clues = db_session.scalars(get_clues_for_category_round_and_airdate(category, round_value, air_date)).all()
-
-                    if len(clues) == 5:
-                        break
-
-                if len(clues) != 5:
-                    # TODO: Add logic to fetch new random category if we can't find 5 for this category
-                    logger.error(
-                        "Could not find 5 clues for category {} with matching air date",
-                        category,
-                    )
-                logger.info("Found {} clues for category {}", len(clues), category)
-
-                # Convert SQLAlchemy objects to dicts and sort by clue_value
-                clues_list = []
-                for clue in clues:
-                    # Ensure we have a proper Clue object
-                    if not hasattr(clue, "id"):
-                        clue = db_session.merge(clue)
-                    clues_list.append(
-                        {
-                            "id": clue.id,
-                            "clue_value": clue.clue_value,
-                            "is_daily_double": clue.is_daily_double,
-                            "clue_text": clue.clue_text,  # The clue/question shown to player
-                            "correct_answer": clue.correct_answer,  # The answer they need to guess
-                            "air_date": clue.air_date.isoformat(),
-                            "notes": clue.notes,
-                        }
-                    )
-
-                # Sort clues by value (200, 400, 600, 800, 1000)
-                clues_list.sort(key=lambda x: x["clue_value"])
-                round_data[category] = clues_list
-
-            return round_data
-
-        finally:
-            db_session.close()
+            # Add the requested category and ensure we have exactly 6 unique categories
+            categories = [category] + [c for c in categories if c != category][:5]
+        logger.info("Found {} random categories: {}", len(categories), categories)
+
+        if not categories:
+            logger.warning("No categories found")
+            raise HTTPException(
+                status_code=404, detail="No categories found for this round"
+            )
 
+        # Assemble the response from cached per-board JSON
+        board_jsons = []
+        for category in categories:
+            air_date = board_index.pick_air_date(round_value, category)
+            if air_date is None:
+                logger.error(
+                    "Could not find 5 clues for category {} with matching air date",
+                    category,
+                )
+                board_json = b"[]"
+            else:
+                board_json = get_board_json(round_value, category, air_date)
+            logger.info("Found board {} for category {}", air_date, category)
+            board_jsons.append(orjson.dumps(category) + b":" + board_json)
+        body = b"{" + b",".join(board_jsons) + b"}"
+        return Response(content=body, media_type="application/json")
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error fetching round data: {}", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
-judge_agent_singleton = get_judge_agent()
+@functools.cache
+def get_judge_agent():
+    """
+    Import and build the judge agent on first use.
+
+    pydantic_ai and the OpenAI client are the slowest imports in the app,
+    and only /answer needs them, so they stay out of server startup.
+    """
+    try:
+        from .agents.agents import get_judge_agent as build_judge_agent
+    except ValueError as e:
+        # Missing API key: a server problem, not a bad request
+        raise RuntimeError(str(e)) from e
+    return build_judge_agent()
+
+
+# Upper bound on judge agent calls in flight at once, across all requests
+MAX_CONCURRENT_JUDGEMENTS = 50
+judge_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JUDGEMENTS)
+
+
+def parse_answer_submission(body: Any) -> tuple[int, str]:
+    """Validate a single {clue_id, user_answer} submission"""
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Answer submission must be an object")
+    if not body.get("clue_id"):
+        raise HTTPException(status_code=400, detail="clue_id is required")
+    if not body.get("user_answer"):
+        raise HTTPException(status_code=400, detail="user_answer is required")
+    if not isinstance(body["user_answer"], str):
+        raise HTTPException(status_code=400, detail="user_answer must be a string")
+
+    # Accept an integer or a string of digits, but not a bool, float or list
+    clue_id = body["clue_id"]
+    if isinstance(clue_id, str) and clue_id.isascii() and clue_id.isdigit():
+        clue_id = int(clue_id)
+    if isinstance(clue_id, bool) or not isinstance(clue_id, int):
+        raise HTTPException(status_code=400, detail="clue_id must be an integer")
+    return clue_id, body["user_answer"]
+
+
+async def judge_answer(clue: Row, user_answer: str) -> Dict[str, Any]:
+    """Ask the judge agent whether user_answer is correct for clue"""
+    logger.info(
+        "Processing answer for clue_id={}: category='{}', clue='{}', correct_answer='{}', user_answer='{}'",
+        clue.id,
+        clue.category,
+        clue.clue_text,
+        clue.correct_answer,
+        user_answer,
+    )
+
+    judgement = judgement_cache.get(clue.id, user_answer)
+    if judgement is not None:
+        logger.info("Judgement cache hit for clue_id={}", clue.id)
+    else:
+        try:
+            # Create judge context. The fields come from the database and
+            # parse_answer_submission, so skip pydantic validation.
+            judge_context = JudgeContext.model_construct(
+                category=clue.category,
+                clue=clue.clue_text,
+                comments=clue.notes if clue.comments else "",
+                correct_answer=clue.correct_answer,
+                user_answer=user_answer,
+            )
+
+            # Get judgement from AI agent
+            logger.debug("Calling judge agent with context: {}", judge_context)
+            async with judge_semaphore:
+                result = await get_judge_agent().run(
+                    "Please evaluate this answer", deps=judge_context
+                )
+            logger.debug("Received judgement response: {}", result)
+        except Exception as e:
+            logger.error("Error from judge agent: {}", str(e))
+            if hasattr(e, "__dict__"):
+                logger.error("Full error details: {}", e.__dict__)
+            raise
+
+        judgement = result.data
+        await judgement_cache.put(clue.id, user_answer, judgement)
+
+    # Convert judgement to response format
+    response = {
+        "correct": judgement.correct,
+        "feedback": judgement.feedback,
+        "user_answer": user_answer,
+        "correct_answer": clue.correct_answer,
+    }
+    logger.info("Answer judged: clue_id={}, result={}", clue.id, response)
+    return response
+
+
 @app.post("/answer", response_model=Dict[str, Any])
 async def submit_answer(request: Request) -> Dict[str, Any]:
     """
@@ -184,69 +379,67 @@ async def submit_answer(request: Request) -> Dict[str, Any]:
         body = await request.json()
         logger.debug("Received answer submission: {}", body)
 
-        # Validate required fields
-        if not body.get("clue_id"):
-            raise HTTPException(status_code=400, detail="clue_id is required")
-        if not body.get("user_answer"):
-            raise HTTPException(status_code=400, detail="user_answer is required")
+        clue_id, user_answer = parse_answer_submission(body)
 
-        clue_id = body["clue_id"]
-        user_answer = body["user_answer"]
+        # Get clue data from the cache or the database
+        clue = (await fetch_clues([clue_id])).get(clue_id)
+        if not clue:
+            logger.warning("Clue not found: id={}", clue_id)
+            raise HTTPException(status_code=404, detail="Clue not found")
 
-        # Create session
-        session = Session(db_engine, future=True)
-        try:
-            # Get clue data from database
-            clue = session.scalar(get_clue_by_id(clue_id))
-            if not clue:
-                logger.warning("Clue not found: id={}", clue_id)
-                raise HTTPException(status_code=404, detail="Clue not found")
-
-            logger.info(
-                "Processing answer for clue_id={}: category='{}', clue='{}', correct_answer='{}', user_answer='{}'",
-                clue_id,
-                clue.category,
-                clue.clue_text,
-                clue.correct_answer,
-                user_answer,
-            )
+        return await judge_answer(clue, user_answer)
 
-            try:
-                # Create judge context
-                judge_context = JudgeContext(
-                    category=clue.category,
-                    clue=clue.clue_text,
-                    comments=clue.notes if clue.comments else "",
-                    correct_answer=clue.correct_answer,
-                    user_answer=user_answer,
-                )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error("Invalid request data: {}", str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected error processing answer: {}", str(e))
+        logger.exception(e)
+        raise HTTPException(
+            status_code=500,
+            detail="An unexpected error occurred while processing your answer",
+        )
 
-                # Get judgement from AI agent
-                logger.debug("Calling judge agent with context: {}", judge_context)
-                judge_agent = judge_agent_singleton
-                judgement = await judge_agent.run(
-                    "Please evaluate this answer", deps=judge_context
+
+@app.post("/answer/batch", response_model=List[Dict[str, Any]])
+async def submit_answers(request: Request) -> List[Dict[str, Any]]:
+    """
+    Submit several answers for judging at once.
+
+    Request body must be a list of objects, each with clue_id and user_answer.
+    The judgements are requested concurrently.
+
+    Returns:
+        List of /answer responses, in the same order as the submissions
+    """
+    try:
+        body = await request.json()
+        logger.debug("Received batch answer submission: {}", body)
+
+        if not isinstance(body, list) or not body:
+            raise HTTPException(
+                status_code=400, detail="Request body must be a non-empty list"
+            )
+        submissions = [parse_answer_submission(item) for item in body]
+
+        # Fetch every uncached clue in the batch with a single query
+        clue_ids = {clue_id for clue_id, _ in submissions}
+        clues_by_id = await fetch_clues(clue_ids)
+        missing = [clue_id for clue_id in clue_ids if clue_id not in clues_by_id]
+        if missing:
+            logger.warning("Clues not found: ids={}", missing)
+            raise HTTPException(status_code=404, detail=f"Clues not found: {missing}")
+
+        return list(
+            await asyncio.gather(
+                *(
+                    judge_answer(clues_by_id[clue_id], user_answer)
+                    for clue_id, user_answer in submissions
                 )
-                logger.debug("Received judgement response: {}", judgement)
-
-                # Convert judgement to response format
-                response = {
-                    "correct": judgement.data.correct,
-                    "feedback": judgement.data.feedback,
-                    "user_answer": user_answer,
-                    "correct_answer": clue.correct_answer,
-                }
-            except Exception as e:
-                logger.error("Error from judge agent: {}", str(e))
-                if hasattr(e, "__dict__"):
-                    logger.error("Full error details: {}", e.__dict__)
-                raise
-
-            logger.info("Answer judged: clue_id={}, result={}", clue_id, response)
-            return response
-
-        finally:
-            session.close()
+            )
+        )
 
     except HTTPException:
         raise
@@ -254,9 +447,9 @@ async def submit_answer(request: Request) -> Dict[str, Any]:
         logger.error("Invalid request data: {}", str(e))
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error("Unexpected error processing answer: {}", str(e))
+        logger.error("Unexpected error processing answers: {}", str(e))
         logger.exception(e)
         raise HTTPException(
             status_code=500,
-            detail="An unexpected error occurred while processing your answer",
+            detail="An unexpected error occurred while processing your answers",
         )
@@ -1,11 +1,19 @@
 from datetime import date
-from sqlalchemy import Column, Integer, String, Boolean, Date
+from sqlalchemy import Column, Integer, String, Boolean, Date, Index, UniqueConstraint
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
 class Clue(Base):
     __tablename__ = 'clues'
+    __table_args__ = (
+        # Backs the /round lookups, which filter on round and category (and
+        # optionally air_date) and sort by clue_value. Its round and
+        # (round, category) prefixes also serve the round-only queries.
+        Index('ix_clues_round_cat_date_val', 'round', 'category', 'air_date', 'clue_value'),
+        # Category lookups that don't filter on round
+        Index('ix_clues_category', 'category'),
+    )
     
     id = Column(Integer, primary_key=True)
     round = Column(Integer)
@@ -17,3 +25,15 @@ class Clue(Base):
     correct_answer = Column(String)
     air_date = Column(Date)
     notes = Column(String)
+
+
+class JudgementRecord(Base):
+    """A judge agent verdict, persisted so repeat answers skip the LLM call"""
+    __tablename__ = 'judgement_cache'
+    __table_args__ = (UniqueConstraint('clue_id', 'user_answer'),)
+
+    id = Column(Integer, primary_key=True)
+    clue_id = Column(Integer)
+    user_answer = Column(String)  # normalized, see agents.judge.normalize_answer
+    correct = Column(Boolean)
+    feedback = Column(String)
@@ -1,40 +1,40 @@
-from sqlalchemy import select, func
+from sqlalchemy import lambda_stmt, select
 
 from .models.models import Clue
 
-
-def get_first_matching_category_by_name(category_name):
-    return select(Clue.category).where(Clue.category == category_name).limit(1)
-
-
-def get_random_categories_matching_round(round, num_categories):
-    query = (
-        select(Clue.category)
-        .where(Clue.round == round)
-        .group_by(Clue.category)
-        .order_by(func.random())
-        .limit(num_categories)
-    )
-    return query
-
-def get_all_airdates_for_category_and_round(category, round):
-    return (
-        select(Clue.air_date)
-        .where(Clue.category == category, Clue.round == round)
-        .distinct()
-        .order_by(Clue.air_date.desc())
+# Every query is a lambda_stmt: SQLAlchemy caches the statement construction
+# and SQL compilation on the lambdas' code locations and binds the closure
+# variables as parameters, so a repeat call skips building the Select.
+
+
+def get_all_round_clues():
+    return lambda_stmt(
+        lambda: select(
+            Clue.id,
+            Clue.round,
+            Clue.category,
+            Clue.clue_value,
+            Clue.is_daily_double,
+            Clue.clue_text,
+            Clue.correct_answer,
+            Clue.air_date,
+            Clue.notes,
+        ).order_by(Clue.round, Clue.category, Clue.air_date.desc(), Clue.clue_value)
     )
 
-def get_clues_for_category_round_and_airdate(category, round, air_date):
-    return (
-        select(Clue)
-        .where(
-            Clue.category == category, 
-            Clue.round == round, 
-            Clue.air_date == air_date)
-        .group_by(Clue.clue_value)
-        .order_by(Clue.clue_value)
+# Columns /answer needs to judge a clue
+def _select_judged_clue_columns():
+    return select(
+        Clue.id,
+        Clue.category,
+        Clue.clue_text,
+        Clue.correct_answer,
+        Clue.notes,
+        Clue.comments,
     )
 
-def get_clue_by_id(clue_id):
-    return select(Clue).where(Clue.id == clue_id)
\ No newline at end of file
+def get_clues_by_ids(clue_ids):
+    clue_ids = list(clue_ids)
+    stmt = lambda_stmt(lambda: _select_judged_clue_columns())
+    stmt += lambda s: s.where(Clue.id.in_(clue_ids))
+    return stmt
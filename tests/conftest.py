@@ -0,0 +1,46 @@
+import asyncio
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.models.models import Base, Clue
+
+
+def make_clue(id, round, category, air_date, clue_value):
+    return {
+        "id": id,
+        "round": round,
+        "category": category,
+        "clue_value": clue_value,
+        "is_daily_double": False,
+        "clue_text": f"clue {id}",
+        "correct_answer": f"answer {id}",
+        "air_date": air_date,
+        "notes": "",
+    }
+
+
+def make_board(first_id, round, category, air_date, values=(200, 400, 600, 800, 1000)):
+    return [
+        make_clue(first_id + i, round, category, air_date, value)
+        for i, value in enumerate(values)
+    ]
+
+
+def make_session_factory(clues=(), url="sqlite+aiosqlite:///:memory:", **engine_kwargs):
+    """Session factory over a fresh database holding clues"""
+    if url.endswith(":memory:"):
+        # StaticPool keeps one connection, so every session sees the same
+        # in-memory database
+        engine_kwargs.setdefault("poolclass", StaticPool)
+    engine = create_async_engine(url, **engine_kwargs)
+
+    async def create_tables():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            if clues:
+                await connection.execute(insert(Clue), list(clues))
+
+    asyncio.run(create_tables())
+    return async_sessionmaker(engine, expire_on_commit=False)
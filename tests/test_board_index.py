@@ -0,0 +1,54 @@
+from datetime import date
+
+from src.board_index import BoardIndex
+
+from conftest import make_board
+
+
+def test_only_complete_boards_are_indexed():
+    rows = (
+        make_board(1, 1, "HISTORY", date(2023, 1, 2), values=(200, 400, 800, 1000))
+        + make_board(10, 1, "HISTORY", date(2023, 1, 1))
+        + make_board(20, 1, "POTPOURRI", date(2023, 1, 1), values=(200, 400, 600))
+    )
+    index = BoardIndex.from_rows(rows)
+
+    assert index.categories_by_round == {1: ["HISTORY"]}
+    assert index.air_dates == {(1, "HISTORY"): [date(2023, 1, 1)]}
+    assert index.all_categories == {"HISTORY", "POTPOURRI"}
+    assert index.pick_air_date(1, "POTPOURRI") is None
+    assert index.pick_air_date(2, "HISTORY") is None
+    assert index.pick_air_date(1, "HISTORY") == date(2023, 1, 1)
+
+    board = index.get_board(1, "HISTORY", date(2023, 1, 1))
+    assert [clue["id"] for clue in board] == [10, 11, 12, 13, 14]
+    assert board[0] == {
+        "id": 10,
+        "clue_value": 200,
+        "is_daily_double": False,
+        "clue_text": "clue 10",
+        "correct_answer": "answer 10",
+        "air_date": date(2023, 1, 1),
+        "notes": "",
+    }
+
+
+def test_duplicate_clue_values_keep_first_clue():
+    rows = make_board(1, 2, "SCIENCE", date(2023, 1, 1), values=(400, 800, 800, 1200, 1600, 2000))
+    index = BoardIndex.from_rows(rows)
+
+    board = index.get_board(2, "SCIENCE", date(2023, 1, 1))
+    assert [clue["id"] for clue in board] == [1, 2, 4, 5, 6]
+
+
+def test_pick_random_categories():
+    rows = [
+        clue
+        for i, category in enumerate(["A", "B", "C"])
+        for clue in make_board(i * 10, 1, category, date(2023, 1, 1))
+    ]
+    index = BoardIndex.from_rows(rows)
+
+    assert sorted(index.pick_random_categories(1, 6)) == ["A", "B", "C"]
+    assert len(index.pick_random_categories(1, 2)) == 2
+    assert index.pick_random_categories(2, 6) == []
@@ -0,0 +1,68 @@
+import asyncio
+from collections import OrderedDict
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+import src.main
+
+from conftest import make_board, make_session_factory
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    """SQL run by fetch_clues against a database of five clues"""
+    session_factory = make_session_factory(make_board(1, 1, "HISTORY", date(2023, 1, 1)))
+    monkeypatch.setattr(src.main, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(src.main, "clue_cache", OrderedDict())
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session_factory.kw["bind"].sync_engine
+    event.listen(engine, "before_cursor_execute", listener)
+    yield statements
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def fetch(clue_ids):
+    return asyncio.run(src.main.fetch_clues(clue_ids))
+
+
+def test_misses_are_fetched_in_one_query(statements):
+    clues = fetch([3, 1, 999])
+
+    assert sorted(clues) == [1, 3]
+    assert clues[3].correct_answer == "answer 3"
+    assert len(statements) == 1
+    assert " IN " in statements[0]
+    assert list(src.main.clue_cache) == [1, 3]
+
+
+def test_hits_skip_the_database_and_become_most_recent(statements):
+    fetch([1, 2, 3])
+    statements.clear()
+
+    clues = fetch([1])
+
+    assert clues[1].id == 1
+    assert statements == []
+    assert list(src.main.clue_cache) == [2, 3, 1]
+
+    # Only the miss is queried
+    fetch([2, 4])
+    assert len(statements) == 1
+    assert list(src.main.clue_cache) == [3, 1, 2, 4]
+
+
+def test_least_recently_used_clues_are_evicted(statements, monkeypatch):
+    monkeypatch.setattr(src.main, "MAX_CACHED_CLUES", 2)
+    fetch([1, 2])
+    fetch([1])  # 2 is now the least recently used
+
+    fetch([3])
+
+    assert list(src.main.clue_cache) == [1, 3]
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from src.agents.judge import JudgementCache
+from src.agents.schemas import Judgement
+
+from conftest import make_session_factory
+
+
+def remember(cache, clue_id, user_answer, correct):
+    cache._remember((clue_id, user_answer), Judgement(correct=correct, feedback=""))
+
+
+def test_exact_hit_ignores_case_and_surrounding_space():
+    cache = JudgementCache(session_factory=None)
+    remember(cache, 1, "george washington", True)
+
+    assert cache.get(1, "  George Washington ").correct is True
+    assert cache.get(2, "george washington") is None
+
+
+@pytest.mark.parametrize(
+    "judged, submitted",
+    [
+        ("what is the 19th amendment", "what is the 18th amendment"),
+        ("world war ii", "world war i"),
+        ("pope john paul ii", "pope john paul i"),
+        ("who is george h.w. bush", "who is george w. bush"),
+    ],
+)
+def test_near_identical_answers_miss(judged, submitted):
+    cache = JudgementCache(session_factory=None)
+    remember(cache, 1, judged, True)
+
+    assert cache.get(1, submitted) is None
+
+
+def test_eviction_drops_least_recently_used():
+    cache = JudgementCache(session_factory=None, maxsize=2)
+    remember(cache, 1, "a", True)
+    remember(cache, 2, "b", True)
+    cache.get(1, "a")  # 2 is now the least recently used
+    remember(cache, 3, "c", False)
+
+    assert list(cache._entries) == [(1, "a"), (3, "c")]
+    assert cache.get(2, "b") is None
+
+
+def test_put_and_load_round_trip():
+    session_factory = make_session_factory()
+
+    async def run():
+        cache = JudgementCache(session_factory)
+        await cache.put(1, "JFK", Judgement(correct=True, feedback=""))
+        await cache.put(1, "Nixon", Judgement(correct=False, feedback="Wrong decade"))
+        await cache.put(2, "Paris", Judgement(correct=True, feedback=""))
+        # Re-judging an answer updates the stored verdict in place
+        await cache.put(1, "nixon", Judgement(correct=False, feedback="Wrong president"))
+
+        # Only room for the two most recently stored verdicts
+        reloaded = JudgementCache(session_factory, maxsize=2)
+        await reloaded.load()
+        return reloaded
+
+    reloaded = asyncio.run(run())
+
+    assert list(reloaded._entries) == [(1, "nixon"), (2, "paris")]
+    assert reloaded.get(1, "Nixon") == Judgement(correct=False, feedback="Wrong president")
+    assert reloaded.get(2, "paris").correct is True
+    assert reloaded.get(1, "jfk") is None
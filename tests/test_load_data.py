@@ -0,0 +1,112 @@
+import pytest
+import sqlalchemy as sa
+
+import src.load_data
+from src.db import configure_sqlite_engine
+from src.load_data import load_data
+from src.models.models import Base
+
+TSV_HEADER = "round\tclue_value\tdaily_double_value\tcategory\tcomments\tanswer\tquestion\tair_date\tnotes\n"
+CLEAN_ROWS = (
+    "1\t200\t0\tHISTORY\t\tHe was the first U.S. president\tGeorge Washington\t2023-01-01\t\n"
+    '1\t400\t1000\tHISTORY\t(Alex: a daily double)\t"It ""began"" in 1914"\tWorld War I\t2023-01-01\tnote\n'
+    "2\t800\t0\tSCIENCE\t\tH2O\tWater\t1999-12-31\t\n"
+)
+
+
+def load_tsv(tmp_path, name, contents):
+    data_path = tmp_path / f"{name}.tsv"
+    data_path.write_text(TSV_HEADER + contents, encoding="utf-8")
+    engine = configure_sqlite_engine(sa.create_engine(f"sqlite:///{tmp_path / name}.db"))
+    load_data(engine, data_path)
+    with engine.connect() as conn:
+        # Raw stored values, to catch differences the ORM types would hide
+        return conn.exec_driver_sql(
+            "SELECT round, clue_value, is_daily_double, category, comments, "
+            "clue_text, correct_answer, air_date, notes FROM clues ORDER BY id"
+        ).all()
+
+
+def fail_if_called(*args):
+    raise AssertionError("wrong load path")
+
+
+def test_clean_file_loads_through_arrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(src.load_data, "insert_rows", fail_if_called)
+    clean_rows = load_tsv(tmp_path, "clean", CLEAN_ROWS)
+
+    assert clean_rows == [
+        (1, 200, 0, "HISTORY", "", "He was the first U.S. president", "George Washington", "2023-01-01", ""),
+        (1, 400, 1, "HISTORY", "(Alex: a daily double)", 'It "began" in 1914', "World War I", "2023-01-01", "note"),
+        (2, 800, 0, "SCIENCE", "", "H2O", "Water", "1999-12-31", ""),
+    ]
+
+
+def test_bad_value_falls_back_to_csv_with_identical_rows(tmp_path, monkeypatch):
+    clean_rows = load_tsv(tmp_path, "clean", CLEAN_ROWS)
+
+    monkeypatch.setattr(src.load_data, "insert_table", fail_if_called)
+    bad_row = "1\tlots\t0\tHISTORY\t\tBad value\tNobody\t2023-01-01\t\n"
+    fallback_rows = load_tsv(tmp_path, "bad", CLEAN_ROWS + bad_row)
+
+    # The malformed row is skipped and everything else is stored exactly as
+    # the Arrow path stores it
+    assert fallback_rows == clean_rows
+
+
+def index_names(engine):
+    with engine.connect() as conn:
+        return sorted(
+            conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'clues'"
+            ).scalars()
+        )
+
+
+def test_load_runs_while_another_connection_is_open(tmp_path):
+    engine = configure_sqlite_engine(sa.create_engine(f"sqlite:///{tmp_path / 'clues'}.db"))
+    Base.metadata.create_all(engine)
+    data_path = tmp_path / "clues.tsv"
+    data_path.write_text(TSV_HEADER + CLEAN_ROWS, encoding="utf-8")
+
+    # Like the API's pooled connections while the server runs
+    with engine.connect() as reader:
+        reader.exec_driver_sql("SELECT count(*) FROM clues").scalar()
+        load_data(engine, data_path)
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("SELECT count(*) FROM clues").scalar() == 3
+    assert index_names(engine) == ["ix_clues_category", "ix_clues_round_cat_date_val"]
+
+
+def test_failed_load_keeps_rows_and_indexes(tmp_path):
+    engine = configure_sqlite_engine(sa.create_engine(f"sqlite:///{tmp_path / 'clues'}.db"))
+    data_path = tmp_path / "clues.tsv"
+    data_path.write_text(TSV_HEADER + CLEAN_ROWS, encoding="utf-8")
+    load_data(engine, data_path)
+
+    # Invalid UTF-8 fails the Arrow parse, then the csv fallback partway in
+    data_path.write_bytes((TSV_HEADER + CLEAN_ROWS).encode() + b"1\t200\t0\t\xff\t\tx\ty\t2023-01-01\t\n")
+    with pytest.raises(UnicodeDecodeError):
+        load_data(engine, data_path)
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT count(*) FROM clues").scalar() == 3
+    assert index_names(engine) == ["ix_clues_category", "ix_clues_round_cat_date_val"]
+
+
+def test_rows_with_empty_values_are_skipped_and_counted(tmp_path, monkeypatch):
+    monkeypatch.setattr(src.load_data, "insert_rows", fail_if_called)
+    warnings = []
+
+    def record_warning(message, *args):
+        warnings.append(message.format(*args))
+
+    monkeypatch.setattr(src.load_data.logger, "warning", record_warning)
+    empty_value_row = "1\t\t0\tHISTORY\t\tNo value\tNobody\t2023-01-01\t\n"
+
+    rows = load_tsv(tmp_path, "empty", CLEAN_ROWS + empty_value_row)
+
+    assert rows == load_tsv(tmp_path, "clean", CLEAN_ROWS)
+    assert warnings == ["Skipped 1 rows with empty required values"]
@@ -0,0 +1,294 @@
+import asyncio
+from collections import OrderedDict
+from datetime import date
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+import src.board_index
+import src.main
+from src.agents.judge import JudgementCache
+from src.agents.schemas import Judgement
+from src.board_index import BoardIndex
+
+from conftest import make_board, make_session_factory
+
+
+@pytest.fixture
+def client(monkeypatch):
+    rows = (
+        make_board(1, 1, "HISTORY", date(2023, 1, 2))
+        + make_board(10, 1, "HISTORY", date(2023, 1, 1))
+        + make_board(20, 1, "SCIENCE", date(2023, 1, 1))
+    )
+    monkeypatch.setattr(src.main, "board_index", BoardIndex.from_rows(rows))
+    monkeypatch.setattr(src.main, "board_json_cache", type(src.main.board_json_cache)())
+    # Pin the random picks: categories in index order, the first air date
+    monkeypatch.setattr(src.board_index.random, "sample", lambda seq, k: list(seq)[:k])
+    monkeypatch.setattr(src.board_index.random, "choice", lambda seq: seq[0])
+    # No lifespan: /round is served from the index alone
+    return TestClient(src.main.app)
+
+
+def test_round_is_built_from_cached_board_json(client):
+    response = client.get("/round/1")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body) == ["HISTORY", "SCIENCE"]
+    assert [clue["id"] for clue in body["HISTORY"]] == [1, 2, 3, 4, 5]
+    assert body["HISTORY"][0]["air_date"] == "2023-01-02"
+    assert list(src.main.board_json_cache) == [
+        (1, "HISTORY", date(2023, 1, 2)),
+        (1, "SCIENCE", date(2023, 1, 1)),
+    ]
+
+    # A second request reuses the cached bytes
+    cached = src.main.board_json_cache[(1, "HISTORY", date(2023, 1, 2))]
+    client.get("/round/1")
+    assert src.main.board_json_cache[(1, "HISTORY", date(2023, 1, 2))] is cached
+
+
+def test_pinned_category_is_served_first(client):
+    response = client.get("/round/1?category=SCIENCE")
+
+    assert response.status_code == 200
+    assert list(response.json()) == ["SCIENCE", "HISTORY"]
+
+
+def test_unknown_pinned_category_is_404(client):
+    response = client.get("/round/1?category=NOPE")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Category 'NOPE' not found"}
+
+
+@pytest.fixture
+def reloads(monkeypatch):
+    calls = []
+
+    async def fake_load_board_index():
+        calls.append(True)
+
+    monkeypatch.setattr(src.main, "load_board_index", fake_load_board_index)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "token, headers",
+    [
+        (None, {}),
+        (None, {"X-Admin-Token": ""}),
+        ("s3cret", {}),
+        ("s3cret", {"X-Admin-Token": "wrong"}),
+    ],
+)
+def test_admin_reload_refuses_without_matching_token(client, reloads, monkeypatch, token, headers):
+    monkeypatch.setattr(src.main, "admin_token", token)
+
+    response = client.post("/admin/reload", headers=headers)
+
+    assert response.status_code == 403
+    assert reloads == []
+
+
+def test_admin_reload_with_token_clears_caches(client, reloads, monkeypatch):
+    monkeypatch.setattr(src.main, "admin_token", "s3cret")
+    monkeypatch.setattr(src.main, "clue_cache", OrderedDict({1: object()}))
+    client.get("/round/1")
+    assert src.main.board_json_cache
+
+    response = client.post("/admin/reload", headers={"X-Admin-Token": "s3cret"})
+
+    assert response.status_code == 200
+    assert reloads == [True]
+    assert not src.main.board_json_cache
+    assert not src.main.clue_cache
+
+
+class FakeJudge:
+    """Stands in for the judge agent: correct only for the exact answer"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run(self, prompt, deps):
+        self.calls.append(deps.user_answer)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return SimpleNamespace(
+            data=Judgement(
+                correct=deps.user_answer == deps.correct_answer,
+                feedback="" if deps.user_answer == deps.correct_answer else "No",
+            )
+        )
+
+
+def use_clue_db(monkeypatch, session_factory, judge):
+    monkeypatch.setattr(src.main, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(src.main, "clue_cache", OrderedDict())
+    monkeypatch.setattr(src.main, "judgement_cache", JudgementCache(session_factory))
+    monkeypatch.setattr(src.main, "get_judge_agent", lambda: judge)
+
+
+def test_concurrent_answers_do_not_exhaust_the_pool(tmp_path, monkeypatch):
+    # A pool smaller than the number of requests in flight: a request that
+    # held its connection while awaiting the judge would starve the others
+    # and its own JudgementCache.put
+    session_factory = make_session_factory(
+        make_board(1, 1, "HISTORY", date(2023, 1, 1)),
+        url=f"sqlite+aiosqlite:///{tmp_path / 'clues.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=1,
+    )
+    judge = FakeJudge(delay=0.2)
+    use_clue_db(monkeypatch, session_factory, judge)
+
+    async def answer_all():
+        transport = httpx.ASGITransport(app=src.main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(
+                    client.post("/answer", json={"clue_id": clue_id, "user_answer": "x"})
+                    for clue_id in (1, 2, 3, 4, 5)
+                )
+            )
+
+    responses = asyncio.run(answer_all())
+
+    assert [response.status_code for response in responses] == [200] * 5
+    assert len(judge.calls) == 5
+
+
+@pytest.fixture
+def judge(monkeypatch):
+    judge = FakeJudge()
+    session_factory = make_session_factory(
+        make_board(1, 1, "HISTORY", date(2023, 1, 1))
+        + make_board(10, 1, "SCIENCE", date(2023, 1, 1))
+    )
+    use_clue_db(monkeypatch, session_factory, judge)
+    return judge
+
+
+@pytest.fixture
+def answer_client(judge):
+    return TestClient(src.main.app)
+
+
+def test_answer_is_judged(answer_client, judge):
+    response = answer_client.post("/answer", json={"clue_id": 1, "user_answer": "answer 1"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "correct": True,
+        "feedback": "",
+        "user_answer": "answer 1",
+        "correct_answer": "answer 1",
+    }
+
+    # The verdict is cached, so a repeat answer skips the judge
+    repeat = answer_client.post("/answer", json={"clue_id": "1", "user_answer": "Answer 1 "})
+    assert repeat.json()["correct"] is True
+    assert judge.calls == ["answer 1"]
+
+
+def test_answer_to_unknown_clue_is_404(answer_client, judge):
+    response = answer_client.post("/answer", json={"clue_id": 999, "user_answer": "x"})
+
+    assert response.status_code == 404
+    assert judge.calls == []
+
+
+@pytest.mark.parametrize(
+    "body, detail",
+    [
+        ([], "Answer submission must be an object"),
+        ({"user_answer": "x"}, "clue_id is required"),
+        ({"clue_id": 1}, "user_answer is required"),
+        ({"clue_id": 1, "user_answer": 7}, "user_answer must be a string"),
+        ({"clue_id": True, "user_answer": "x"}, "clue_id must be an integer"),
+        ({"clue_id": 1.9, "user_answer": "x"}, "clue_id must be an integer"),
+        ({"clue_id": [1], "user_answer": "x"}, "clue_id must be an integer"),
+        ({"clue_id": "1.5", "user_answer": "x"}, "clue_id must be an integer"),
+        ({"clue_id": "-1", "user_answer": "x"}, "clue_id must be an integer"),
+    ],
+)
+def test_invalid_answer_submission_is_400(answer_client, judge, body, detail):
+    response = answer_client.post("/answer", json=body)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": detail}
+    assert judge.calls == []
+
+
+def test_batch_results_keep_submission_order(answer_client, judge):
+    submissions = [
+        {"clue_id": 12, "user_answer": "answer 12"},
+        {"clue_id": 1, "user_answer": "wrong"},
+        {"clue_id": 12, "user_answer": "also wrong"},
+        {"clue_id": 3, "user_answer": "answer 3"},
+    ]
+
+    response = answer_client.post("/answer/batch", json=submissions)
+
+    assert response.status_code == 200
+    assert [
+        (result["user_answer"], result["correct_answer"], result["correct"])
+        for result in response.json()
+    ] == [
+        ("answer 12", "answer 12", True),
+        ("wrong", "answer 1", False),
+        ("also wrong", "answer 12", False),
+        ("answer 3", "answer 3", True),
+    ]
+
+
+def test_batch_with_unknown_clues_is_404(answer_client, judge):
+    response = answer_client.post(
+        "/answer/batch",
+        json=[{"clue_id": 1, "user_answer": "x"}, {"clue_id": 999, "user_answer": "x"}],
+    )
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Clues not found: [999]"}
+    assert judge.calls == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"clue_id": 1, "user_answer": "x"},
+        [],
+        [{"clue_id": 1, "user_answer": "x"}, {"clue_id": True, "user_answer": "x"}],
+    ],
+)
+def test_invalid_batch_is_400(answer_client, judge, body):
+    response = answer_client.post("/answer/batch", json=body)
+
+    assert response.status_code == 400
+    assert judge.calls == []
+
+
+def test_batch_judgements_are_capped_by_the_semaphore(answer_client, judge, monkeypatch):
+    monkeypatch.setattr(src.main, "judge_semaphore", asyncio.Semaphore(2))
+    judge.delay = 0.05
+
+    response = answer_client.post(
+        "/answer/batch",
+        json=[{"clue_id": clue_id, "user_answer": "x"} for clue_id in (1, 2, 3, 4, 5)],
+    )
+
+    assert response.status_code == 200
+    assert len(judge.calls) == 5
+    assert judge.max_in_flight == 2